@@ -61,7 +61,6 @@ One may include some PTYX code of course.
 
     """
 
-from importlib import metadata
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -69,10 +68,19 @@ if TYPE_CHECKING:
     from ptyx.latex_generator import Compiler
 
 
-__version__ = metadata.version(__package__)
 __all__ = ["__version__", "main", "extend_compiler"]
 
 
+def __getattr__(name: str) -> str:
+    # `__version__` is computed lazily, since importing `importlib.metadata` is slow,
+    # and this module is imported by `mcq` command line interface (including for autocompletion).
+    if name == "__version__":
+        from importlib import metadata
+
+        return metadata.version(__package__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def extend_compiler() -> "CompilerExtension":
     """This function is called by pTyX extension machinery to add new tags to the compiler.
 
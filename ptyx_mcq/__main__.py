@@ -0,0 +1,15 @@
+"""
+Run `mcq` command line interface using `python -m ptyx_mcq`.
+
+This is convenient for profiling, for example:
+
+    $ python -X importtime -m ptyx_mcq --help
+    $ PYTHONHASHSEED=0 python -m cProfile -s cumtime -m ptyx_mcq make path/to/mcq
+
+Note that `PYTHONHASHSEED` must be set when profiling `mcq make` or `mcq scan`,
+since the process would be restarted otherwise (see `ptyx_mcq.cli.disable_hash_randomization()`).
+"""
+
+from ptyx_mcq.cli import main
+
+main()
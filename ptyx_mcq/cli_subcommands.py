@@ -0,0 +1,356 @@
+"""
+Description of the subcommands of the `mcq` command line interface.
+
+This module only contains data, so that it may be imported cheaply (see `ptyx_mcq.cli`),
+and the parser of the `mcq` command is generated from it.
+"""
+
+from ptyx_mcq.default_template import DEFAULT_TEMPLATE_NAME
+
+# Description of all the `mcq` subcommands.
+# Each subcommand is described by a dict, with the following keys:
+#   - "help": the help message of the subcommand,
+#   - "arguments": a list of `(names, options)` couples, which will be passed to `add_argument(*names, **options)`;
+#     `options` may also include a "completer" key (see `ptyx_mcq.cli.COMPLETERS` for the available completers),
+#     and the "path" type may be used for arguments to be converted to `pathlib.Path` instances,
+#   - "handler": the name of the function called to execute the subcommand (see `ptyx_mcq.cli.HANDLERS`),
+#   - "enforce_determinism": if set to `True`, hash randomization will be disabled (see `ptyx_mcq.cli.launcher()`),
+#   - "subcommands": for subcommands having their own subcommands (like `mcq update config-file`),
+#     a dict describing them with the same format (no handler is needed then).
+SUBCOMMANDS: dict[str, dict] = {
+    # ------------------------------------------
+    #     $ mcq new
+    # ==========================================
+    "new": {
+        "help": "Create an empty ptyx file.",
+        "arguments": [
+            (
+                ("path",),
+                {
+                    "nargs": "?",
+                    "metavar": "PATH",
+                    "type": "path",
+                    "default": "new-mcq",
+                    "help": "The name or the path of the new file to create.",
+                    "completer": "directories",
+                },
+            ),
+            (
+                ("--include", "-i"),
+                {
+                    "metavar": "INCLUDE_PATH",
+                    "type": "path",
+                    "help": "Include all .ex files from this path in the generated .ptyx file.",
+                    "completer": "directories",
+                },
+            ),
+            (
+                ("--template", "-t"),
+                {
+                    "metavar": "TEMPLATE_NAME",
+                    "type": str,
+                    "default": "",
+                    "help": (
+                        "Specify the name of the template to use.\nIf not specified, search for a template named "
+                        "'default' in the user config directory, or use the default template.\n"
+                        f"One may force the use of the default template by writing '{DEFAULT_TEMPLATE_NAME}'."
+                    ),
+                    "completer": "templates",
+                },
+            ),
+        ],
+        "handler": "new",
+    },
+    # ------------------------------------------
+    #     $ mcq make
+    # ==========================================
+    "make": {
+        "help": "Generate pdf file.",
+        "arguments": [
+            (
+                ("path",),
+                {"nargs": "?", "metavar": "PATH", "type": "path", "default": ".", "completer": "ptyx_files"},
+            ),
+            (
+                ("--num", "-n"),
+                {
+                    "metavar": "N",
+                    "type": int,
+                    "default": 1,
+                    "help": "Specify how many versions of the document must be generated.",
+                },
+            ),
+            (
+                ("--start", "-s"),
+                {"metavar": "START", "type": int, "default": 1, "help": "First document number (default=1)."},
+            ),
+            (("--quiet", "-q"), {"action": "store_true", "help": "Hide pdflatex output."}),
+            (("--with-correction", "-c"), {"action": "store_true", "help": "Generate correction too."}),
+            (
+                ("--for-review", "-r"),
+                {
+                    "action": "store_true",
+                    "help": "For each question, display its title and its different versions (if any). "
+                    "Useful for reviewing a mcq.",
+                },
+            ),
+            (
+                ("--force", "-f"),
+                {
+                    "action": "store_true",
+                    "help": "Force the build of a new document even if a previous one exist, "
+                    "without asking what to do.",
+                },
+            ),
+        ],
+        "handler": "make",
+        "enforce_determinism": True,
+    },
+    # ------------------------------------------
+    #     $ mcq scan
+    # ==========================================
+    "scan": {
+        "help": "Generate scores from scanned documents.",
+        "arguments": [
+            (
+                ("path",),
+                {
+                    "nargs": "?",
+                    "default": ".",
+                    "help": (
+                        "Path to a directory which must contain "
+                        "a `.mcq.config` file and a `scan/` subdirectory "
+                        "(alternatively, this path may point to any file in this folder)."
+                    ),
+                    "completer": "directories",
+                },
+            ),
+            (
+                ("--reset",),
+                {
+                    "action": "store_true",
+                    "help": "Delete all cached data. The scanning process will restart from the beginning.",
+                },
+            ),
+            (
+                ("--cores",),
+                {
+                    "metavar": "N",
+                    "type": int,
+                    "default": 0,
+                    "help": "Set the number of cores to use (when set to 0 (default),"
+                    " the number of cores will be set automatically)."
+                    " Setting cores to 1 will disable multiprocessing and make scanning more verbose.",
+                },
+            ),
+            (
+                ("--debug",),
+                {
+                    "action": "store_true",
+                    "default": False,
+                    "help": "Debugging mode: display the picture with coloured squares at each step "
+                    "to review scanning process.",
+                },
+            ),
+            (
+                ("--test-picture",),
+                {
+                    "type": "path",
+                    "default": None,
+                    "help": "Used for debugging: scan only this picture, without storing scan's results.",
+                    "completer": "jpg_files",
+                },
+            ),
+        ],
+        "handler": "scan",
+        "enforce_determinism": True,
+    },
+    # ------------------------------------------
+    #     $ mcq clear
+    # ==========================================
+    "clear": {
+        "help": "Remove every MCQ data but the ptyx file.",
+        "arguments": [(("path",), {"nargs": "?", "metavar": "PATH", "type": "path", "default": "."})],
+        "handler": "clear",
+    },
+    # ------------------------------------------
+    #     $ mcq see
+    # ==========================================
+    "see": {
+        "help": "Show the pdf corresponding to the given student.",
+        "arguments": [
+            (
+                ("name",),
+                {
+                    "nargs": "?",
+                    "metavar": "NAME",
+                    "type": str,
+                    "help": "The name of the student, or part of it. "
+                    'Wildcard may be used, like "J*hn*" (use quotes then).',
+                },
+            )
+        ],
+        "handler": "see",
+    },
+    # ------------------------------------------
+    #     $ mcq fix
+    # ==========================================
+    "fix": {
+        "help": "Resolve the conflicts for the specified documents.",
+        "subcommands": {
+            # $ mcq fix doc
+            # ------------------------
+            "doc": {
+                "help": "Resolve conflicts concerning the students answers.",
+                # TODO: add completers ?
+                "arguments": [
+                    (
+                        ("-d", "--doc"),
+                        {"metavar": "DOC", "type": int, "help": "The identifier of the document."},
+                    ),
+                    (("-p", "--page"), {"metavar": "PAGE", "type": int, "help": "The page of the document."}),
+                    (("-n", "--name"), {"metavar": "NAME", "type": str, "help": "The name of the student."}),
+                    (
+                        ("-i", "--id"),
+                        {"metavar": "ID", "type": str, "help": "The identifier of the student."},
+                    ),
+                ],
+                "handler": "fix_doc",
+            },
+            # $ mcq fix name
+            # ------------------------
+            "name": {
+                "help": "Resolve conflicts concerning the students name.",
+                # TODO: add a completer ?
+                "arguments": [
+                    (("--doc",), {"metavar": "DOC", "type": int, "help": "The identifier of the document."}),
+                ],
+                "handler": "fix_name",
+            },
+        },
+    },
+    # ------------------------------------------
+    #     $ mcq update
+    # ==========================================
+    "update": {
+        "help": "Update/synchronize some files of the MCQ directory.",
+        "subcommands": {
+            # $ mcq update config-file
+            # ------------------------
+            "config-file": {
+                "help": "Synchronize the mcq configuration file with the .ptyx file.",
+                "arguments": [
+                    (
+                        ("path",),
+                        {
+                            "nargs": "?",
+                            "metavar": "PATH",
+                            "type": "path",
+                            "default": ".",
+                            "help": "The .ptyx file from which the configuration file must be updated.",
+                            "completer": "ptyx_files",
+                        },
+                    ),
+                ],
+                "handler": "update_config_file",
+            },
+            # $ mcq update exercises
+            # ------------------------
+            "exercises": {
+                "help": "Update the list of the imported exercises.",
+                "arguments": [
+                    (
+                        ("path",),
+                        {
+                            "nargs": "?",
+                            "metavar": "PATH",
+                            "type": "path",
+                            "default": ".",
+                            "help": "Path of the .ptyx file to update.",
+                            "completer": "ptyx_files",
+                        },
+                    ),
+                    (
+                        ("--force",),
+                        {
+                            "action": "store_true",
+                            "default": False,
+                            "help": "Force update, even if it doesn't seem safe "
+                            "(pTyX code and include directives are intricate).",
+                        },
+                    ),
+                    (
+                        ("--clean",),
+                        {
+                            "action": "store_true",
+                            "default": False,
+                            "help": "Remove imports corresponding to missing files, and any import comments.",
+                        },
+                    ),
+                ],
+                "handler": "update_exercises",
+            },
+        },
+    },
+    # ------------------------------------------
+    #     $ mcq template
+    # ==========================================
+    "template": {
+        "help": "Manage templates.",
+        "subcommands": {
+            # $ mcq template create
+            # ------------------------
+            "create": {
+                "help": "Create a customisable user template.",
+                "arguments": [
+                    (
+                        ("name",),
+                        {
+                            "nargs": "?",
+                            "metavar": "NAME",
+                            "type": str,
+                            "default": "default",
+                            "help": "The template name must be a valid new directory name.",
+                        },
+                    ),
+                ],
+                "handler": "create_templates",
+            },
+            # $ mcq template list
+            # -------------------
+            "list": {"help": "List all available templates.", "handler": "list_templates"},
+        },
+    },
+    # ------------------------------------------
+    #     $ mcq doc
+    # ==========================================
+    "doc": {
+        "help": "Display information about available options and evaluation strategies.",
+        "subcommands": {
+            # $ mcq doc strategies
+            # --------------------
+            "strategies": {"help": "Document available evaluation strategies.", "handler": "doc_strategies"},
+            # $ mcq doc config
+            # ----------------
+            "config": {"help": "Document ptyx files configuration options.", "handler": "doc_config"},
+        },
+    },
+    # ------------------------------------------
+    #     $ mcq install
+    # ==========================================
+    "install": {
+        "help": "Manage pTyX-MCQ installation.",
+        "subcommands": {
+            # $ mcq install shell-completion
+            # ------------------------------
+            "shell-completion": {
+                "help": "Enable completion for the `mcq` command in the shell (only bash is supported for now).",
+                "arguments": [
+                    (("--shell",), {"type": str, "default": "bash", "choices": ("bash", "zsh", "fish")}),
+                ],
+                "handler": "install_shell_completion",
+            },
+        },
+    },
+    # TODO: enable to update pTyX-MCQ version.
+}
@@ -0,0 +1,8 @@
+"""
+Name of the default template.
+
+This is kept in a module without any import (contrary to `ptyx_mcq.parameters`, which imports `pathlib`),
+since it is needed by the `mcq` command line interface, which must start as fast as possible.
+"""
+
+DEFAULT_TEMPLATE_NAME = "original"
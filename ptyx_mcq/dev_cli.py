@@ -7,24 +7,22 @@ ptyx MCQ Specific command line interface for development
 @author: Nicolas Pourcelot
 """
 from argparse import ArgumentParser
-from enum import StrEnum
 from pathlib import Path
-from typing import Optional
 
-from argcomplete import FilesCompleter
+from ptyx_mcq.cli import launcher, PTYX_FILES_COMPLETER, VersionAction
 
-from ptyx_mcq.cli import launcher
 
-
-class DevHandlers(StrEnum):
-    export_checkboxes = "ptyx_mcq.other_commands.dev.export_checkboxes"
-    calibration = "ptyx_mcq.other_commands.dev.calibration"
-    review = "ptyx_mcq.other_commands.dev.review"
+DEV_HANDLERS: dict[str, str] = {
+    "export_checkboxes": "ptyx_mcq.other_commands.dev.export_checkboxes",
+    "calibration": "ptyx_mcq.other_commands.dev.calibration",
+    "review": "ptyx_mcq.other_commands.dev.review",
+}
 
 
 # noinspection PyTypeHints
 def create_mcq_dev_arg_parser() -> ArgumentParser:
     parser = ArgumentParser(description="Development tools for pTyX-MCQ.")
+    parser.add_argument("--version", action=VersionAction)
     subparsers = parser.add_subparsers()
     add_parser = subparsers.add_parser
 
@@ -37,9 +35,9 @@ def create_mcq_dev_arg_parser() -> ArgumentParser:
     )
     export_checkboxes_parser.add_argument(  # type: ignore[attr-defined]
         "path", nargs="?", metavar="PATH", type=Path, default="."
-    ).completer = FilesCompleter("ptyx")
+    ).completer = PTYX_FILES_COMPLETER
 
-    export_checkboxes_parser.set_defaults(handler=DevHandlers.export_checkboxes)
+    export_checkboxes_parser.set_defaults(handler=DEV_HANDLERS["export_checkboxes"])
 
     # ------------------------------------------
     #     $ mcq-dev review
@@ -51,8 +49,8 @@ def create_mcq_dev_arg_parser() -> ArgumentParser:
     )  # .completer = FilesCompleter("ptyx")
     review_picture_parser.add_argument(  # type: ignore[attr-defined]
         "path", nargs="?", metavar="PATH", type=Path, default="."
-    ).completer = FilesCompleter("ptyx")
-    review_picture_parser.set_defaults(handler=DevHandlers.review)
+    ).completer = PTYX_FILES_COMPLETER
+    review_picture_parser.set_defaults(handler=DEV_HANDLERS["review"])
 
     # ------------------------------------------
     #     $ mcq-dev calibration
@@ -66,13 +64,13 @@ def create_mcq_dev_arg_parser() -> ArgumentParser:
     )  # .completer = FilesCompleter("ptyx")
     calibration_picture_parser.add_argument(  # type: ignore[attr-defined]
         "path", nargs="?", metavar="PATH", type=Path, default="."
-    ).completer = FilesCompleter("ptyx")
-    calibration_picture_parser.set_defaults(handler=DevHandlers.calibration)
+    ).completer = PTYX_FILES_COMPLETER
+    calibration_picture_parser.set_defaults(handler=DEV_HANDLERS["calibration"])
 
     return parser
 
 
-def main(args: Optional[list] = None, _restart_process_if_needed=True) -> None:
+def main(args: list | None = None, _restart_process_if_needed=True) -> None:
     launcher(create_mcq_dev_arg_parser, args, _restart_process_if_needed=_restart_process_if_needed)
 
 
@@ -1,5 +1,4 @@
 import shutil
-from os import unlink
 from pathlib import Path
 
 from ptyx.shell import print_success
@@ -14,10 +13,10 @@ def clear(path: Path) -> None:
     filename = ptyxfile_path.name
     root = ptyxfile_path.parent
     for directory in ("out/.cache", ".compile"):
-        try:
+        # Test existence first, instead of catching `FileNotFoundError` (missing files are the common case).
+        if (root / directory).exists():
             shutil.rmtree(root / directory)
-        except FileNotFoundError as e:
-            print(f"Warning: {e}")
+        else:
             print(f"Info: '{directory}' not found...")
     for filepath in (
         ptyxfile_path.with_suffix(".pdf"),
@@ -25,9 +24,8 @@ def clear(path: Path) -> None:
         ptyxfile_path.with_name(f".{filename}.plain-ptyx"),
         ptyxfile_path.with_name(f"{ptyxfile_path.stem}-corr.pdf"),
     ):
-        try:
-            unlink(filepath)
-        except FileNotFoundError as e:
-            print(f"Warning: {e}")
+        if filepath.exists():
+            filepath.unlink()
+        else:
             print(f"Info: '{filepath}' not found...")
     print_success("Directory cleared.")
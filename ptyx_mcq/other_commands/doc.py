@@ -5,6 +5,16 @@ from ptyx.shell import ANSI_REVERSE_PURPLE, ANSI_RESET, ANSI_BLUE, ANSI_REVERSE_
 from ptyx_mcq.scan.score_management.evaluation_strategies import EvaluationStrategies
 from ptyx_mcq.make.extend_latex_generator import HeaderConfigKeys
 
+# Match the beginning of an option description in `HeaderConfigKeys` docstring.
+OPTION_DESCRIPTION_RE = re.compile(r" {4}- (\w+):")
+
+
+# Frames used to display each option's description.
+FRAME_TOP = f" {ANSI_BLUE}╭───╴{ANSI_RESET}{ANSI_REVERSE_BLUE} "
+FRAME_TOP_END = f" {ANSI_RESET} "
+FRAME_LEFT = f" {ANSI_BLUE}│{ANSI_RESET} "
+FRAME_BOTTOM = f" {ANSI_BLUE}╰───╴{ANSI_RESET}"
+
 
 def _document_options(title: str, options_info: dict[str, str]) -> None:
     """Helper function to display all the available options for a given category in the terminal.
@@ -12,18 +22,16 @@ def _document_options(title: str, options_info: dict[str, str]) -> None:
     After listing all the options, each option will be described.
     """
     # Display options list.
-    print(f"\n{ANSI_REVERSE_PURPLE}[ {title} ]{ANSI_RESET}")
-    print(", ".join(options_info))
-    print()
+    lines = [f"\n{ANSI_REVERSE_PURPLE}[ {title} ]{ANSI_RESET}", ", ".join(options_info), ""]
     # Describe each option.
-    print(f"\n{ANSI_REVERSE_PURPLE}[ Details ]{ANSI_RESET}")
+    lines.append(f"\n{ANSI_REVERSE_PURPLE}[ Details ]{ANSI_RESET}")
     for option_name, option_doc in options_info.items():
-        print(f"\n {ANSI_BLUE}╭───╴{ANSI_RESET}{ANSI_REVERSE_BLUE} {option_name} {ANSI_RESET} ")
-        print(f" {ANSI_BLUE}│{ANSI_RESET} ")
-        for line in option_doc.split("\n"):
-            print(f" {ANSI_BLUE}│{ANSI_RESET} " + line.strip())
-        print(f" {ANSI_BLUE}│{ANSI_RESET} ")
-        print(f" {ANSI_BLUE}╰───╴{ANSI_RESET}")
+        lines.append("\n" + FRAME_TOP + option_name + FRAME_TOP_END)
+        lines.append(FRAME_LEFT)
+        lines.extend(FRAME_LEFT + line.strip() for line in option_doc.split("\n"))
+        lines.append(FRAME_LEFT)
+        lines.append(FRAME_BOTTOM)
+    print("\n".join(lines))
 
 
 def doc_strategies() -> None:
@@ -42,8 +50,8 @@ def doc_config() -> None:
     keys = HeaderConfigKeys.__members__
     current_key: str | None = None
     info: dict[str, list[str]] = {}
-    for line in HeaderConfigKeys.__doc__.split("\n"):  # type: ignore
-        if match := re.match(" {4}- (\\w+):", line):
+    for line in HeaderConfigKeys.__doc__.splitlines():  # type: ignore
+        if match := OPTION_DESCRIPTION_RE.match(line):
             current_key = match.group(1)
             if current_key not in keys:
                 raise RuntimeError(f"Unknown option: {current_key!r}")
@@ -28,11 +28,19 @@ def install_shell_completion(shell: str = "bash") -> None:
         )
         raise FatalError
 
+    # Read `.bashrc` only once, and append all the missing lines at once.
+    bash_rc = Path("~/.bashrc").expanduser()
+    bash_rc_lines = set(bash_rc.read_text().splitlines()) if bash_rc.is_file() else set()
     done = []
-    if _install_completion(f"mcq-{shell}-completion", "mcq", CLI_SCRIPT, shell):
-        done.append("`mcq`")
-    if _install_completion(f"mcq-dev-{shell}-completion", "mcq-dev", DEV_CLI_SCRIPT, shell):
-        done.append("`mcq-dev`")
+    new_lines = ""
+    for command, python_script in (("mcq", CLI_SCRIPT), ("mcq-dev", DEV_CLI_SCRIPT)):
+        completion_file = _install_completion(f"{command}-{shell}-completion", command, python_script, shell)
+        if f"source {completion_file}" not in bash_rc_lines:
+            new_lines += f"\n# Enable {command} command completion\nsource {completion_file}\n"
+            done.append(f"`{command}`")
+    if new_lines:
+        with open(bash_rc, "a") as f:
+            f.write(new_lines)
 
     if done:
         print_success(f"Completion enabled in {shell} for {' and '.join(done)}. Enjoy!")
@@ -40,16 +48,10 @@ def install_shell_completion(shell: str = "bash") -> None:
         print_info(f"Completion in {shell} was already activated. Nothing done.")
 
 
-def _install_completion(completion_file_name, command, python_script, shell) -> bool:
+def _install_completion(completion_file_name, command, python_script, shell) -> Path:
+    """Generate the completion file, and return its path."""
     completion_file = PlatformDirs().user_config_path / "ptyx-mcq/config" / completion_file_name
     completion_file.parent.mkdir(parents=True, exist_ok=True)
     with open(completion_file, "w") as f:
         f.write(argcomplete.shellcode([command], shell=shell, argcomplete_script=str(python_script)))
-    bash_rc = Path("~/.bashrc").expanduser()
-    newlines = f"\n# Enable {command} command completion\nsource {completion_file}\n"
-    if not (bash_rc.is_file() and newlines in bash_rc.read_text()):
-        with open(bash_rc, "a") as f:
-            f.write(newlines)
-        return True
-    else:
-        return False
+    return completion_file
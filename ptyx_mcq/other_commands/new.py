@@ -1,3 +1,4 @@
+import os
 import shutil
 from pathlib import Path
 
@@ -28,24 +29,27 @@ def new(path: Path, include: Path = None, template="") -> None:
             shutil.rmtree(path / "questions", ignore_errors=True)
             # Edit the .ptyx file, to replace default code with the list of the questions' files.
             ptyx_path = get_file_or_sysexit(path, extension=".ptyx")
-            new_lines = [f"-- DIR: {include.resolve()}"]
-            for include_path in include.glob("**/*.ex"):
-                new_lines.append(f"-- {include_path.relative_to(include)}")
-            lines = []
-            with open(ptyx_path, encoding="utf8") as f:
+            # Write the new content to a temporary file, line by line, then replace the original file.
+            tmp_path = ptyx_path.with_suffix(".ptyx.tmp")
+            with open(ptyx_path, encoding="utf8") as f, open(tmp_path, "w", encoding="utf8") as tmp:
                 include_section = False
                 for line in f:
-                    line = line.rstrip("\n")
+                    line = line.rstrip("\n") + "\n"
                     if line.startswith("<<<<"):
                         include_section = True
-                        lines.append(line)
-                        lines.extend(new_lines)
+                        tmp.write(line)
+                        tmp.write(f"-- DIR: {include.resolve()}\n")
+                        # `os.walk()` is faster than `Path.glob("**/*.ex")`, since no `Path` instance
+                        # is created for non-matching files.
+                        for root, _, filenames in os.walk(include):
+                            directory = Path(root).relative_to(include)
+                            for filename in filenames:
+                                if filename.endswith(".ex"):
+                                    tmp.write(f"-- {directory / filename}\n")
                     elif line.startswith(">>>>"):
                         include_section = False
-                        lines.append(line)
+                        tmp.write(line)
                     elif not include_section:
-                        lines.append(line)
-
-            with open(ptyx_path, "w", encoding="utf8") as f:
-                f.write("\n".join(lines) + "\n")
+                        tmp.write(line)
+            os.replace(tmp_path, ptyx_path)
         print_success(f"A new MCQ was created at {path}.")
@@ -26,4 +26,5 @@ def see(name: str) -> None:
         print_warning("No matching file.")
     else:
         print_info(f"Displaying {results[0]}")
-        subprocess.run(["xdg-open", str(results[0])])
+        # Don't wait for the viewer: `mcq see` may return immediately.
+        subprocess.Popen(["xdg-open", str(results[0])], start_new_session=True)
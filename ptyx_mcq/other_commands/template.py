@@ -1,15 +1,23 @@
-import shutil
+import os
+from functools import cache
 from pathlib import Path
 
 from platformdirs import PlatformDirs
-from ptyx.shell import print_error, print_success, ANSI_CYAN, ANSI_RESET, ANSI_PURPLE
 
-from ptyx_mcq.tools.io_tools import FatalError
-from ptyx_mcq.parameters import DEFAULT_TEMPLATE_NAME, DEFAULT_TEMPLATE_FULLPATH
+from ptyx_mcq.default_template import DEFAULT_TEMPLATE_NAME
+
+# This module is imported by shell completion (see `ptyx_mcq.cli.TemplatesCompleter`),
+# so heavy imports (`ptyx.shell` and `ptyx_mcq.tools.io_tools` especially) must only occur inside functions.
 
 
 def create_template(name: str = "default") -> None:
     """Create default user template."""
+    import shutil
+
+    from ptyx.shell import print_error, print_success
+    from ptyx_mcq.parameters import DEFAULT_TEMPLATE_FULLPATH
+    from ptyx_mcq.tools.io_tools import FatalError
+
     if name == DEFAULT_TEMPLATE_NAME:
         print_error(f"Name {name!r} is reserved, please choose another template name.")
         raise FatalError
@@ -24,12 +32,13 @@ def create_template(name: str = "default") -> None:
 
 def list_templates() -> None:
     """List all available templates."""
+    from ptyx.shell import ANSI_CYAN, ANSI_RESET, ANSI_PURPLE
+
     print("Default pTyX-MCQ template:")
     print(f" {ANSI_PURPLE}{DEFAULT_TEMPLATE_NAME}{ANSI_RESET}")
     print("User-created templates:")
-    for path in get_user_templates_path().glob("*"):
-        if path.is_dir():
-            print(f"- {ANSI_CYAN}{path.name}{ANSI_RESET}")
+    for name in get_user_templates_names():
+        print(f"- {ANSI_CYAN}{name}{ANSI_RESET}")
 
 
 def get_template_path(template_name: str = "") -> Path:
@@ -38,6 +47,10 @@ def get_template_path(template_name: str = "") -> Path:
     The template is first searched in user config directory.
     If not found, a default template is applied.
     """
+    from ptyx.shell import print_error
+    from ptyx_mcq.parameters import DEFAULT_TEMPLATE_FULLPATH
+    from ptyx_mcq.tools.io_tools import FatalError
+
     # Default template:
     template_path = DEFAULT_TEMPLATE_FULLPATH
     # Directory of the eventual user templates:
@@ -46,7 +59,8 @@ def get_template_path(template_name: str = "") -> Path:
         # Search for a default user-defined template.
         user_default_template_path = user_templates_path / "default"
         if user_default_template_path.is_dir():
-            template_path = user_default_template_path
+            # No need to test it again.
+            return user_default_template_path
     elif template_name != DEFAULT_TEMPLATE_NAME:
         template_path = user_templates_path / template_name
     if not template_path.is_dir():
@@ -55,6 +69,18 @@ def get_template_path(template_name: str = "") -> Path:
     return template_path
 
 
-def get_user_templates_path():
+@cache
+def get_user_templates_path() -> Path:
     """Return the path of the directory where the user's templates are stored."""
     return PlatformDirs().user_config_path / "ptyx-mcq/templates"
+
+
+def get_user_templates_names() -> list[str]:
+    """Return the names of all the user-created templates."""
+    try:
+        # Using `os.scandir()` avoids a `stat` system call for each entry,
+        # which matters since this is used for shell completion.
+        with os.scandir(get_user_templates_path()) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
+        return []
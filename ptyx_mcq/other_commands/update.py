@@ -4,7 +4,12 @@ from ptyx.shell import print_error, print_success
 
 from ptyx_mcq.tools.io_tools import FatalError
 from ptyx_mcq.parameters import CONFIG_FILE_EXTENSION
-from ptyx_mcq.tools.config_parser import Configuration
+from ptyx_mcq.tools.config_parser import (
+    Configuration,
+    DocumentId,
+    OriginalQuestionNumber,
+    OriginalAnswerNumber,
+)
 from ptyx_mcq.tools.io_tools import get_file_or_sysexit
 from ptyx_mcq.make.include_directives_parsing import update_file
 from ptyx.latex_generator import Compiler
@@ -47,20 +52,31 @@ def update_config_file(path: Path) -> None:
 
 
 def same_questions_and_answers_numbers(config1: Configuration, config2: Configuration) -> bool:
-    if list(config1.ordering) != list(config2.ordering):
-        return False
-    for doc_id in config1.ordering:
-        ordering1 = config1.ordering[doc_id]
-        ordering2 = config2.ordering[doc_id]
-        if ordering1["questions"] != ordering2["questions"]:
-            return False
-        if list(ordering1["answers"]) != list(ordering2["answers"]):
-            return False
+    """Test if both configurations have the same questions and answers, in the same order.
 
-        for q in ordering1["answers"]:
-            if [a for a, _ in ordering1["answers"][q]] != [a for a, _ in ordering2["answers"][q]]:
-                return False
-    return True
+    The answers' correctness is not compared.
+    """
+    return _questions_and_answers_numbers(config1) == _questions_and_answers_numbers(config2)
+
+
+def _questions_and_answers_numbers(
+    config: Configuration,
+) -> list[
+    tuple[
+        DocumentId,
+        list[OriginalQuestionNumber],
+        list[tuple[OriginalQuestionNumber, list[OriginalAnswerNumber]]],
+    ]
+]:
+    """Return the ordering of the questions and answers, for each document, ignoring answers' correctness."""
+    return [
+        (
+            doc_id,
+            ordering["questions"],
+            [(q, [a for a, _ in answers]) for q, answers in ordering["answers"].items()],
+        )
+        for doc_id, ordering in config.ordering.items()
+    ]
 
 
 def update_exercises(path: Path, force=False, clean=False) -> None:
@@ -1,11 +1,12 @@
 from pathlib import Path
 
+from ptyx_mcq.default_template import DEFAULT_TEMPLATE_NAME
+
 # The root of the package, i.e. the `ptyx_mcq` directory.
 PACKAGE_ROOT = Path(__file__).resolve().parent
 
 # Default template path
 DEFAULT_TEMPLATE_DIR = "assets/templates"
-DEFAULT_TEMPLATE_NAME = "original"
 DEFAULT_TEMPLATE_FULLPATH = PACKAGE_ROOT / DEFAULT_TEMPLATE_DIR / DEFAULT_TEMPLATE_NAME
 
 CACHE_DIR = ".cache"
@@ -5,6 +5,7 @@ Test new, make and scan subcommands.
 """
 
 import csv
+from argparse import ArgumentParser, Namespace
 import shutil
 from functools import partial
 from os import listdir
@@ -17,8 +18,16 @@ import pymupdf  # type: ignore
 
 from ptyx.shell import print_info
 
-from ptyx_mcq.cli import main as main_, Handlers, get_handler
-from ptyx_mcq.dev_cli import DevHandlers
+from ptyx_mcq.cli import (
+    main as main_,
+    HANDLERS,
+    get_handler,
+    TemplatesCompleter,
+    SUBCOMMANDS,
+    create_mcq_arg_parser,
+    sniff_subcommand,
+)
+from ptyx_mcq.dev_cli import DEV_HANDLERS
 from ptyx_mcq.parameters import CELL_SIZE_IN_CM, DEFAULT_TEMPLATE_NAME
 from ptyx_mcq.tools.colors import Color, RGB
 from ptyx_mcq.tools.math import round
@@ -27,6 +36,9 @@ from ptyx_mcq.tools.config_parser import (
     is_answer_correct,
     StudentId,
     StudentName,
+    DocumentId,
+    OriginalQuestionNumber,
+    OriginalAnswerNumber,
 )
 from ptyx_mcq.tools.pdf import similar_pdfs
 
@@ -156,13 +168,95 @@ def test_many_docs(tmp_path):
 
 def test_handlers() -> None:
     """Test that all command line handlers do still exist."""
-    handler: Handlers | DevHandlers
-    for handler in Handlers:
+    for handler in HANDLERS.values():
         assert callable(get_handler(handler))
-    for handler in DevHandlers:
+    for handler in DEV_HANDLERS.values():
         assert callable(get_handler(handler))
 
 
+def test_subcommands_handlers() -> None:
+    """Test that every subcommand of the command line interface is associated with an existing handler."""
+
+    def check(subcommands: dict[str, dict]) -> None:
+        for description in subcommands.values():
+            if "subcommands" in description:
+                check(description["subcommands"])
+            else:
+                assert callable(get_handler(HANDLERS[description["handler"]]))
+
+    check(SUBCOMMANDS)
+
+
+def test_version(capsys) -> None:
+    """Test that `mcq --version` displays the version number of pTyX-MCQ."""
+    from ptyx_mcq import __version__
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--version"])
+    assert exc_info.value.code == 0
+    assert capsys.readouterr().out.strip().endswith(f" {__version__}")
+
+
+def test_help_without_subcommands_arguments(capsys) -> None:
+    """Test that `mcq` help is the same when subcommands arguments are not added to the parser."""
+    main([])
+    assert capsys.readouterr().out == create_mcq_arg_parser().format_help()
+    assert create_mcq_arg_parser(()).format_help() == create_mcq_arg_parser().format_help()
+
+
+def test_sniff_subcommand() -> None:
+    """Test that only the parser of the given subcommand is needed to parse the command line."""
+    assert sniff_subcommand([]) == ()
+    assert sniff_subcommand(["--help"]) == ()
+    assert sniff_subcommand(["unknown", "make"]) == ()
+    assert sniff_subcommand(["make", "-n", "3", "new"]) == ("make",)
+    assert sniff_subcommand(["update", "--help"]) == ("update",)
+    assert sniff_subcommand(["update", "exercises", "--force", "f.ptyx"]) == ("update", "exercises")
+    for args in (["new", "path", "-t", "tpl"], ["update", "exercises", "--force"], ["scan", "--reset", "p"]):
+        kwargs = vars(create_mcq_arg_parser(sniff_subcommand(args)).parse_args(args))
+        expected = vars(create_mcq_arg_parser().parse_args(args))
+        # Subparsers objects are different, of course.
+        kwargs.pop("subparser", None)
+        expected.pop("subparser", None)
+        assert kwargs == expected
+
+
+def test_templates_completer(tmp_path, monkeypatch) -> None:
+    """Test that user templates are proposed when completing `mcq new --template`."""
+    monkeypatch.setattr(
+        "ptyx_mcq.other_commands.template.get_user_templates_path", lambda: tmp_path / "templates"
+    )
+    parser = ArgumentParser()
+    action = parser.add_argument("--template")
+    complete = partial(TemplatesCompleter(), prefix="", action=action, parser=parser, parsed_args=Namespace())
+    # Templates folder doesn't exist yet.
+    assert complete() == [DEFAULT_TEMPLATE_NAME]
+    (tmp_path / "templates/my-template").mkdir(parents=True)
+    (tmp_path / "templates/not-a-template.txt").touch()
+    assert complete() == [DEFAULT_TEMPLATE_NAME, "my-template"]
+
+
+def test_same_questions_and_answers_numbers() -> None:
+    from ptyx_mcq.other_commands.update import same_questions_and_answers_numbers
+
+    doc_id = DocumentId(1)
+    q1, q2 = OriginalQuestionNumber(1), OriginalQuestionNumber(2)
+    a1, a2 = OriginalAnswerNumber(1), OriginalAnswerNumber(2)
+    config1 = Configuration(
+        ordering={doc_id: {"questions": [q2, q1], "answers": {q2: [(a1, True), (a2, False)], q1: []}}}
+    )
+    config2 = Configuration(
+        ordering={doc_id: {"questions": [q2, q1], "answers": {q2: [(a1, False), (a2, True)], q1: []}}}
+    )
+    # Answers' correctness may change.
+    assert same_questions_and_answers_numbers(config1, config2)
+    config2.ordering[doc_id]["answers"][q2].reverse()
+    assert not same_questions_and_answers_numbers(config1, config2)
+    config2.ordering[doc_id]["answers"][q2].reverse()
+    config2.ordering[doc_id]["questions"].reverse()
+    assert not same_questions_and_answers_numbers(config1, config2)
+
+
 def test_cli(tmp_path: Path) -> None:
     number_of_documents = 2
     # Make a temporary directory